@@ -1,4 +1,4 @@
-from Claim_Handle.agent import create_graph, graph
+from Claim_Handle.agent import create_graph, get_graph
 from Claim_Handle.schemas import (
     ContextualSentence,
     DisambiguatedContent,
@@ -11,6 +11,7 @@ from Claim_Handle.schemas import (
 __all__ = [
     # Main functionality
     "create_graph",
+    "get_graph",
     "graph",
     # Data models
     "State",
@@ -19,4 +20,11 @@ __all__ = [
     "DisambiguatedContent",
     "PotentialClaim",
     "ValidatedClaim",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Compile the workflow on first access rather than at package import
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(name)
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import sys
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -55,4 +56,14 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+@lru_cache(maxsize=1)
+def get_graph() -> CompiledStateGraph:
+    """Return the compiled workflow, building it on first use."""
+    return create_graph()
+
+
+def __getattr__(name):
+    # `graph` is compiled lazily so importing the module stays cheap
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(name)
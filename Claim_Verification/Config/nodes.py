@@ -5,6 +5,8 @@ QUERY_GENERATION_CONFIG = {
 
 EVIDENCE_RETRIEVAL_CONFIG = {
     "results_per_query": 3,  # Number of search results to fetch per query
+    "cache_ttl_seconds": 600,  # How long identical queries reuse cached evidence
+    "cache_max_entries": 1024,  # In-process cache size before oldest entries are evicted
 }
 
 EVIDENCE_EVALUATION_CONFIG = {
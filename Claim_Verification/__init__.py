@@ -1,4 +1,4 @@
-from Claim_Verification.agent import create_graph, graph
+from Claim_Verification.agent import create_graph, get_graph
 from Claim_Verification.schemas import (
     Evidence,
     Verdict,
@@ -10,6 +10,7 @@ from Claim_Verification.schemas import (
 __all__ = [
     # Main functionality
     "create_graph",
+    "get_graph",
     "graph",
     # Data models
     "ClaimVerifierState",
@@ -17,4 +18,11 @@ __all__ = [
     "Verdict",
     "VerificationResult",
     "IntermediateAssessment",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Compile the workflow on first access rather than at package import
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(name)
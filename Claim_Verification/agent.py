@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
 import sys
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from langgraph.graph import END, StateGraph
@@ -19,6 +21,14 @@ from Claim_Verification.schemas import ClaimVerifierState
 
 load_dotenv()
 
+# Prefer uvloop's event loop when installed (not available on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop  # type: ignore
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 from utils.logging import setup_logging, get_logger
 
 # Centralized logging config
@@ -52,5 +62,15 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+@lru_cache(maxsize=1)
+def get_graph() -> CompiledStateGraph:
+    """Return the compiled workflow, building it on first use."""
+    return create_graph()
+
+
+def __getattr__(name):
+    # `graph` is compiled lazily so importing the module stays cheap
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(name)
 
@@ -3,40 +3,195 @@
 Replaced Exa/Tavily with GoogleEvidenceRetriever to minimize external API keys.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List
+import os
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
 
 from fact_checker.nodes.google_evidence_retriever import (
+    GoogleEvidenceRetriever,
     create_evidence_retriever,
 )
 
 from Claim_Verification.Config.nodes import EVIDENCE_RETRIEVAL_CONFIG
 from Claim_Verification.schemas import ClaimVerifierState, Evidence
 
+# Optional shared cache backend
+try:
+    import redis.asyncio as aioredis  # type: ignore
+    _HAS_REDIS = True
+except Exception:
+    aioredis = None  # type: ignore
+    _HAS_REDIS = False
+
 logger = logging.getLogger(__name__)
 
 # Retrieval settings
 RESULTS_PER_QUERY = EVIDENCE_RETRIEVAL_CONFIG["results_per_query"]
+CACHE_TTL_SECONDS = EVIDENCE_RETRIEVAL_CONFIG["cache_ttl_seconds"]
+CACHE_MAX_ENTRIES = EVIDENCE_RETRIEVAL_CONFIG["cache_max_entries"]
 
+# Cap outbound searches so claim fan-out stays under Custom Search rate limits.
+# Semaphores bind to the loop that first waits on them, so keep one per loop.
+_SEARCH_CONCURRENCY = int(os.getenv("GCSE_MAX_CONCURRENCY", "5"))
+_search_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
 
-_retriever = None
 
+def _get_search_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _search_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _search_semaphores[loop] = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+    return semaphore
+
+
+@lru_cache(maxsize=1)
+def _get_retriever() -> GoogleEvidenceRetriever:
+    """Shared evidence retriever; reads GCP keys from env on first call."""
+    return create_evidence_retriever()
+
+
+# Build the retriever at import so the first search doesn't pay client and
+# cache setup on the event loop. ATHENA_LAZY_RETRIEVER=1 defers it (tests,
+# environments without search credentials).
+if os.getenv("ATHENA_LAZY_RETRIEVER") != "1":
+    load_dotenv()
+    try:
+        _get_retriever()
+    except ValueError as e:
+        logger.warning(f"Evidence retriever not initialized at import: {e}")
+
+
+# Query cache: key -> (expires_at, evidence)
+_cache: Dict[str, Tuple[float, List[Evidence]]] = {}
+_redis: Optional[Any] = None
+
+# Searches currently running: key -> task resolving to their evidence
+_inflight: Dict[str, "asyncio.Task[List[Evidence]]"] = {}
+
+
+def _cache_key(query: str) -> str:
+    return hashlib.blake2b(query.strip().lower().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_store(key: str, evidence: List[Evidence]) -> None:
+    if key not in _cache and len(_cache) >= CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        _cache.pop(next(iter(_cache)))
+    _cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, evidence)
+
+
+def _get_redis() -> Optional[Any]:
+    global _redis
+    redis_url = os.getenv("REDIS_URL")
+    if _redis is None and _HAS_REDIS and redis_url:
+        try:
+            _redis = aioredis.from_url(redis_url)
+        except Exception as e:
+            logger.warning(f"Failed to connect search cache to Redis: {e}")
+    return _redis
+
+
+async def _cache_get(key: str) -> Optional[List[Evidence]]:
+    entry = _cache.get(key)
+    if entry is not None:
+        expires_at, evidence = entry
+        if expires_at > time.monotonic():
+            return evidence
+        _cache.pop(key, None)
+
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(f"athena:evidence:{key}")
+    except Exception as e:
+        logger.warning(f"Redis search cache read failed: {e}")
+        return None
+    if raw is None:
+        return None
+    evidence = [Evidence(**item) for item in json.loads(raw)]
+    _cache_store(key, evidence)
+    return evidence
+
+
+async def _cache_set(key: str, evidence: List[Evidence]) -> None:
+    _cache_store(key, evidence)
+
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        payload = json.dumps([item.model_dump() for item in evidence])
+        await client.setex(f"athena:evidence:{key}", CACHE_TTL_SECONDS, payload)
+    except Exception as e:
+        logger.warning(f"Redis search cache write failed: {e}")
+
+
+async def _fetch_evidence(query: str, key: str) -> List[Evidence]:
+    cached = await _cache_get(key)
+    if cached is not None:
+        logger.info(f"Search cache hit for: '{query}'")
+        return cached
 
-async def _search_query(query: str) -> List[Evidence]:
-    global _retriever
-    if _retriever is None:
-        # Defer creation to first use; will read GCP keys from env
-        _retriever = create_evidence_retriever()
     logger.info(f"Searching with Google: '{query}'")
-    docs = _retriever.retrieve_evidence(query, top_k=RESULTS_PER_QUERY, search_results=max(RESULTS_PER_QUERY, 10))
+    async with _get_search_semaphore():
+        docs = await _get_retriever().retrieve_evidence_async(query, top_k=RESULTS_PER_QUERY, search_results=RESULTS_PER_QUERY)
+    # Search hits are plain strings already; skip per-field validation
     evidence = [
-        Evidence(url=d.get("link", d.get("url", "")), text=d.get("snippet", d.get("text", "")), title=d.get("title", ""))
+        Evidence.model_construct(
+            url=d.get("link", d.get("url", "")),
+            text=d.get("snippet", d.get("text", "")),
+            title=d.get("title", ""),
+            is_influential=False,
+        )
         for d in docs
     ]
     logger.info(f"Retrieved {len(evidence)} evidence items")
+    # Don't pin empty results; they are usually quota or transient failures
+    if evidence:
+        await _cache_set(key, evidence)
     return evidence
 
 
+async def _search_query(query: str) -> List[Evidence]:
+    key = _cache_key(query)
+
+    # Concurrent claims often produce the same query; share one lookup. The
+    # fetch runs as its own task and every caller awaits it through shield,
+    # so cancelling one caller (e.g. a wait_for timeout) never cancels the
+    # search for the others.
+    task = _inflight.get(key)
+    if task is not None:
+        logger.info(f"Joining in-flight search for: '{query}'")
+    else:
+        task = asyncio.ensure_future(_fetch_evidence(query, key))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _finish_search(key, done))
+    return await asyncio.shield(task)
+
+
+def _finish_search(key: str, task: "asyncio.Task[List[Evidence]]") -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark a failure as retrieved in case every caller was cancelled
+        task.exception()
+
+
+async def close_retriever() -> None:
+    """Release the shared retriever's pooled HTTP connections."""
+    if _get_retriever.cache_info().currsize:
+        await _get_retriever().aclose()
+
+
 async def retrieve_evidence_node(
     state: ClaimVerifierState,
 ) -> Dict[str, List[Evidence]]:
@@ -47,4 +202,6 @@ async def retrieve_evidence_node(
     evidence = await _search_query(state.query)
     logger.info(f"Retrieved {len(evidence)} total evidence snippets")
 
-    return {"evidence": [item.model_dump() for item in evidence]}
+    # Evidence instances pass through state validation as-is; nothing downstream
+    # mutates them, so cached items can be shared across claims
+    return {"evidence": evidence}
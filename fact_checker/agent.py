@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from langgraph.graph import END, StateGraph
@@ -7,17 +8,27 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fact_checker.nodes import (
-    claim_verifier_node,
-    dispatch_claims_for_verification,
-    extract_claims,
-    generate_report_node,
-)
+# Import the node functions from their modules: once a submodule such as
+# fact_checker.nodes.extract_claims is loaded, the package attribute of the
+# same name is the module, not the function
+from fact_checker.nodes.claim_verifier import claim_verifier_node
+from fact_checker.nodes.dispatch_claims import dispatch_claims_for_verification
+from fact_checker.nodes.extract_claims import extract_claims
+from fact_checker.nodes.generate_report import generate_report_node
 from fact_checker.schemas import State
 import asyncio
 
 
 load_dotenv()
+
+# Prefer uvloop's event loop when installed (not available on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop  # type: ignore
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 from utils.logging import setup_logging, get_logger
 
 # Centralized logging config
@@ -55,7 +66,18 @@ def create_graph() -> CompiledStateGraph:
     return workflow.compile()
 
 
-graph = create_graph()
+@lru_cache(maxsize=1)
+def get_graph() -> CompiledStateGraph:
+    """Return the compiled workflow, building it on first use."""
+    return create_graph()
+
+
+def __getattr__(name):
+    # `graph` is compiled lazily so importing the module stays cheap
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(name)
+
 
 async def check_those_facts():
     # This is where you put the text you want to check
@@ -71,13 +93,18 @@ async def check_those_facts():
     # This will store our final report when it's ready
     final_report = None
 
-    # The graph.astream gives you a play-by-play of what's happening
-    # You could use graph.ainvoke() instead if you just want the final result
-    async for event in graph.astream(input_data):
-        for key, value in event.items():
-            logger.info(f"Node: {key} completed!")
-            if key == "generate_report_node":  # Last step
-                final_report = value.get("final_report")
+    # With stream_mode="values" each event is the full state after a step, so
+    # we can stop as soon as the report exists. max_concurrency bounds how many
+    # claim_verifier branches LangGraph runs in parallel.
+    config = {"max_concurrency": int(os.getenv("CLAIM_MAX_CONCURRENCY", "4"))}
+    async for state in get_graph().astream(input_data, config=config, stream_mode="values"):
+        logger.info(
+            f"Step completed: {len(state.get('extracted_claims', []))} claims extracted, "
+            f"{len(state.get('verification_results', []))} verified"
+        )
+        final_report = state.get("final_report")
+        if final_report:  # Last step
+            break
 
     # Log the final report
     if final_report:
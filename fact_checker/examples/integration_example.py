@@ -8,44 +8,125 @@ This example demonstrates:
 
 import asyncio
 import logging
+import re
 import sys
 import os
-import json
+
+import numpy as np
+import orjson
+
+# Optional JIT for the sentence heuristics; falls back to precompiled regexes
+try:
+    from numba import njit  # type: ignore
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
 
 # Add the parent directory to the path to import the fact_checker modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fact_checker.config import Config
-from Claim_Handle.agent import graph as claim_extractor_graph
-from Claim_Handle.schemas import State as ClaimExtractorState
-from Claim_Verification.agent import graph as claim_verifier_graph
-from Claim_Verification.schemas import ClaimVerifierState
+from fact_checker.agent import get_graph as get_fact_checker_graph
 
 from utils.logging import setup_logging
 setup_logging(level=os.getenv("LOG_LEVEL", "INFO"), log_file_path="logs/fact_checker.log")
 logger = logging.getLogger(__name__)
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-z]+\b")
+_DIGIT_RE = re.compile(r"\d")
+
+# The byte kernel models non-ASCII text as letters and U+00A0 (NBSP) only;
+# anything else (curly quotes, dashes, non-ASCII digits) takes the regex path
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _kernel_safe(s: str) -> bool:
+    return s.isascii() or all(c.isalpha() or c == "\xa0" for c in _NON_ASCII_RE.findall(s))
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _nbsp_at(buf, i):
+        """Whether the two bytes at i are U+00A0 in UTF-8 (C2 A0)."""
+        return i + 1 < buf.shape[0] and buf[i] == 0xC2 and buf[i + 1] == 0xA0
+
+    @njit(cache=True)
+    def _word_before(buf, i):
+        """Whether the character ending just before byte i is a \\w character."""
+        if i == 0:
+            return False
+        b = buf[i - 1]
+        if b >= 0x80:
+            # Any non-ASCII letter is a word character; NBSP is not
+            return not (i >= 2 and _nbsp_at(buf, i - 2))
+        return (48 <= b <= 57) or (65 <= b <= 90) or (97 <= b <= 122) or b == 95
+
+    @njit(cache=True)
+    def _word_at(buf, i):
+        """Whether the character starting at byte i is a \\w character."""
+        if i >= buf.shape[0]:
+            return False
+        b = buf[i]
+        if b >= 0x80:
+            return not _nbsp_at(buf, i)
+        return (48 <= b <= 57) or (65 <= b <= 90) or (97 <= b <= 122) or b == 95
+
+    @njit(cache=True)
+    def _score_bytes(buf):
+        """Count capitalized words and digits in a single pass over UTF-8 bytes."""
+        count = 0
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            b = buf[i]
+            if 48 <= b <= 57:
+                count += 1
+                i += 1
+            elif 65 <= b <= 90 and not _word_before(buf, i):
+                j = i + 1
+                while j < n and 97 <= buf[j] <= 122:
+                    j += 1
+                if j > i + 1 and not _word_at(buf, j):
+                    count += 1
+                i = j
+            else:
+                i += 1
+        return count
+
+
+def _count_factual_tokens(s: str) -> int:
+    """Number of proper nouns plus digits in a sentence."""
+    if _HAS_NUMBA and _kernel_safe(s):
+        return int(_score_bytes(np.frombuffer(s.encode("utf-8"), dtype=np.uint8)))
+    return len(_PROPER_NOUN_RE.findall(s)) + len(_DIGIT_RE.findall(s))
+
 
 class EnhancedClaimVerifier:
-    """Thin orchestrator that calls Claim_Handle and Claim_Verification graphs."""
+    """Thin orchestrator around the fact_checker graph (Claim_Handle + Claim_Verification)."""
     
-    def __init__(self):
-        """Initialize the enhanced claim verifier."""
+    def __init__(self, max_concurrency: int = 4):
+        """Initialize the enhanced claim verifier.
+
+        Args:
+            max_concurrency: Maximum number of claims verified at the same time
+        """
         # Validate configuration
         if not Config.validate_gcp_config():
             raise ValueError("GCP configuration is incomplete. Please check your environment variables.")
-        
+
+        self.max_concurrency = max(1, max_concurrency)
+
         logger.info("Enhanced claim verifier initialized successfully (graphs mode)")
     
     # -------- Content-focused helpers (discount style) --------
     def _factual_nucleus_sampling(self, sentences: list) -> list:
         """Keep sentences with higher factual density (entities, numbers, dates)."""
         def score(s: str) -> int:
-            import re
+            lowered = s.lower()
             return sum([
-                len(re.findall(r"\b[A-Z][a-z]+\b", s)),  # Proper nouns
-                len(re.findall(r"\d", s)),                # Numbers/dates
-                1 if "according to" in s.lower() or "report" in s.lower() else 0,
+                _count_factual_tokens(s),  # Proper nouns, numbers/dates
+                1 if "according to" in lowered or "report" in lowered else 0,
             ])
         pairs = [(s.strip(), score(s)) for s in sentences if s and s.strip()]
         pairs.sort(key=lambda x: x[1], reverse=True)
@@ -54,8 +135,7 @@ class EnhancedClaimVerifier:
 
     def _extract_atomic_claims(self, text: str) -> list:
         """Very lightweight atomic-claim extraction: split and filter declaratives."""
-        import re
-        parts = re.split(r"(?<=[.!?])\s+", text.strip())
+        parts = _SENTENCE_SPLIT_RE.split(text.strip())
         return [p for p in parts if len(p.split()) >= 6 and not p.endswith("?")]
 
     def _verdict_from_analysis(self, analysis: dict) -> tuple[str, str, str]:
@@ -73,30 +153,18 @@ class EnhancedClaimVerifier:
         print(f"LLM Rationale: {rationale}")
         print(f"Prediction: {prediction}    Ground Truth: {ground_truth}")
 
-    async def extract_claims(self, text: str) -> list:
-        state = ClaimExtractorState(answer_text=text)
-        result = await claim_extractor_graph.ainvoke(state)
-        return result.get("validated_claims", [])
-
-    async def verify_claims(self, validated_claims: list) -> list:
-        verdicts = []
-        for vc in validated_claims:
-            v_state = ClaimVerifierState(
-                claim=vc,
-                query=None,
-                all_queries=[],
-                evidence=[],
-                verdict=None,
-                iteration_count=0,
-                intermediate_assessment=None,
-            )
-            out = await claim_verifier_graph.ainvoke(v_state)
-            verdicts.append(out.get("verdict"))
-        return verdicts
-
     async def run(self, text: str) -> dict:
-        validated_claims = await self.extract_claims(text)
-        verdicts = await self.verify_claims(validated_claims)
+        # The fact_checker graph extracts claims and fans them out through Send;
+        # max_concurrency bounds the parallel claim_verifier branches
+        result = await get_fact_checker_graph().ainvoke(
+            {"answer": text},
+            config={"max_concurrency": self.max_concurrency},
+        )
+        validated_claims = result.get("extracted_claims", [])
+
+        # Verdicts arrive in completion order; line them up with their claims
+        by_claim = {v.claim_text: v for v in result.get("verification_results", [])}
+        verdicts = [by_claim.get(vc.claim_text) for vc in validated_claims]
         return {"validated_claims": validated_claims, "verdicts": verdicts}
     
     def _analyze_evidence(self, claim: str, evidence: list) -> dict:
@@ -118,11 +186,15 @@ class EnhancedClaimVerifier:
             }
         
         # Calculate relevance scores
-        relevance_scores = [doc.get("similarity_score", 0.0) for doc in evidence]
-        avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.0
+        relevance_scores = np.fromiter(
+            (doc.get("similarity_score", 0.0) for doc in evidence),
+            dtype=np.float64,
+            count=len(evidence),
+        )
+        avg_relevance = float(relevance_scores.mean())
         
         # Calculate source diversity
-        unique_sources = len(set(doc.get("display_link", doc.get("link", "")) for doc in evidence))
+        unique_sources = len({doc.get("display_link", doc.get("link", "")) for doc in evidence})
         
         # Simple credibility scoring (in a real system, you'd want more sophisticated logic)
         credibility_score = min(1.0, avg_relevance * 0.8 + (unique_sources / len(evidence)) * 0.2)
@@ -248,7 +320,10 @@ async def main():
         }
 
         print("\nJSON output (compact):")
-        print(json.dumps(json_output, ensure_ascii=False, indent=2))
+        # Flush pending print() text before writing raw UTF-8 bytes
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(json_output, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.flush()
         print("\n✅ Completed end-to-end verification with graphs.")
     except Exception as e:
         logger.error(f"Error in main: {e}")
@@ -5,8 +5,7 @@ Interfaces with the claim verifier subsystem to check factual accuracy.
 
 import logging
 from typing import Dict
-from Claim_Verification import Verdict, graph as claim_verifier_graph
-from fact_checker.schemas import VerificationResult, ClaimVerifierState, Evidence, Verdict as VerdictModel
+from Claim_Verification import Verdict, get_graph as get_claim_verifier_graph
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +28,7 @@ async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
     verifier_payload = {"claim": claim}
 
     try:
-        verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
+        verifier_result = await get_claim_verifier_graph().ainvoke(verifier_payload)
         verdict = verifier_result.get("verdict")
 
         if verdict:
@@ -3,7 +3,7 @@
 import logging
 from typing import Any, Dict
 
-from Claim_Handle import graph as claim_extractor_graph
+from Claim_Handle import get_graph as get_claim_extractor_graph
 
 from fact_checker.schemas import State
 
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 import logging
 from typing import Any, Dict
-from Claim_Handle import graph as claim_extractor_graph
+from Claim_Handle import get_graph as get_claim_extractor_graph
 from fact_checker.schemas import State
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def extract_claims(state: State) -> Dict[str, Any]:
     extractor_payload = {"answer_text": state.answer}
 
     try:
-        extractor_result = await claim_extractor_graph.ainvoke(extractor_payload)
+        extractor_result = await get_claim_extractor_graph().ainvoke(extractor_payload)
         validated_claims = extractor_result.get("validated_claims", [])
         logger.info(f"Extracted {len(validated_claims)} validated claims")
 
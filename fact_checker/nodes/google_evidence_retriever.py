@@ -7,11 +7,22 @@ This module provides a drop-in replacement for Exa using:
 """
 
 import os
+import time
+import threading
+import uuid
+import glob
+import atexit
 import logging
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, Dict, Optional
 from datetime import datetime, timezone
 import json
+import re
+import zlib
 import numpy as np
 
 # Optional imports for Generative AI (Gemini) embeddings
@@ -29,9 +40,93 @@ try:
 except Exception:
     _HAS_HTTPX = False
 
+# Optional SIMD kernels for cosine similarity
+try:
+    import simsimd  # type: ignore
+    _HAS_SIMSIMD = True
+except Exception:
+    _HAS_SIMSIMD = False
+
+# Optional fast JSON for the search cache, embedding keys and quota state
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# In-memory search cache bound; the append-only log is folded into the
+# snapshot file after this many writes
+_CACHE_MAX_ENTRIES = int(os.getenv("GCP_SEARCH_CACHE_MAX_ENTRIES", "1024"))
+_CACHE_COMPACT_EVERY = 1000
+
+# Snippet embedding rows kept in memory and on disk; the oldest quarter is
+# dropped when full. Unreferenced matrix files (from other workers or
+# earlier runs) older than the grace period are deleted.
+_EMB_MAX_ENTRIES = int(os.getenv("GCP_EMBEDDINGS_MAX_ENTRIES", "10000"))
+_EMB_ORPHAN_GRACE_SECONDS = 60.0
+
+# Shared keep-alive session for the sync Custom Search client; urllib3
+# retries transient errors with exponential backoff and honours Retry-After
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        ),
+    ),
+)
+
+# Fallback embeddings hash words into this many buckets (power of two)
+SIMPLE_EMBEDDING_DIM = 4096
+_TOKEN_RE = re.compile(r"\b\w+\b")
+
+# Re-ranking priors for trusted domains and document types
+_TLD_BOOST = {
+    "gov": 0.08,
+    "edu": 0.06,
+    "org": 0.02,
+}
+_PDF_RE = re.compile(r"\.pdf($|[?#])")
+
+
+def _domain_boost(display_link: str) -> float:
+    """Prior for the host's top-level domain, also matching e.g. gov.uk / edu.au."""
+    labels = display_link.lower().split("/", 1)[0].rsplit(".", 2)
+    boost = _TLD_BOOST.get(labels[-1], 0.0)
+    if not boost and len(labels) > 1 and len(labels[-1]) == 2:
+        boost = _TLD_BOOST.get(labels[-2], 0.0)
+    return boost
+
+
+def _dtype_boost(link: str) -> float:
+    b = 0.0
+    if _PDF_RE.search(link):
+        b += 0.02
+    if "wikipedia.org" in link:
+        b += 0.01
+    return b
+
+
 class GoogleEvidenceRetriever:
     """Evidence retriever using Google Cloud Platform services."""
     
@@ -71,10 +166,31 @@ class GoogleEvidenceRetriever:
                 self._genai_client = None
         else:
             logger.info("Using fallback embedding method (simple vector)")
-        # Simple file cache
+        # Simple file cache; GCP_DISABLE_DISK_CACHE=1 keeps caches in memory only
+        self._persist = os.getenv("GCP_DISABLE_DISK_CACHE") != "1"
         self.cache_path = os.getenv("GCP_SEARCH_CACHE", os.path.join("logs", ".google_search_cache.json"))
-        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        self.cache_log_path = self.cache_path + ".log"
+        if self._persist:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
         self._cache = self._load_cache()
+        # Gemini snippet embeddings: one unit-length float16 row per snippet in a
+        # contiguous matrix, with a parallel list of snippet keys; persisted as
+        # .npy for mmap loading, next to a .keys.json naming the current matrix
+        self.embeddings_path = os.getenv("GCP_EMBEDDINGS_CACHE", os.path.join("logs", ".google_embeddings_f16.npy"))
+        self._emb_file = None
+        self._emb_matrix, self._emb_keys = self._load_embeddings()
+        self._emb_index = {key: row for row, key in enumerate(self._emb_keys)}
+        # rerank runs in worker threads from the async path; guards the matrix
+        self._emb_lock = threading.Lock()
+        # New rows are flushed at most every GCP_EMBEDDINGS_FLUSH_SECONDS and at exit
+        self._emb_flush_interval = float(os.getenv("GCP_EMBEDDINGS_FLUSH_SECONDS", "30"))
+        self._emb_dirty = False
+        self._emb_last_flush = time.monotonic()
+        if self._persist:
+            atexit.register(self.flush_embeddings)
+        # Pooled async HTTP client, created lazily on the running event loop
+        self._http = None
+        self._http_loop = None
     
     def search_web(self, query: str, num_results: int = 10) -> List[Dict]:
         """Query Google Custom Search and retrieve snippets.
@@ -88,8 +204,10 @@ class GoogleEvidenceRetriever:
         """
         # Cache first
         cache_key = f"sync::{query}::{num_results}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
 
         # Enforce daily API quota before making a request
         if not _quota_manager.can_consume(1):
@@ -105,19 +223,10 @@ class GoogleEvidenceRetriever:
         }
         
         try:
-            # Basic retry/backoff for transient errors
-            for attempt in range(2):
-                try:
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    results = response.json()
-                    break
-                except requests.exceptions.HTTPError as he:  # 429/5xx
-                    if attempt == 0 and (response.status_code >= 500 or response.status_code == 429):
-                        import time as _t
-                        _t.sleep(1.5)
-                        continue
-                    raise
+            # Retries with backoff for 429/5xx are handled by the session's adapter
+            response = _SESSION.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            results = response.json()
             
             hits = []
             for item in results.get("items", []):
@@ -133,8 +242,7 @@ class GoogleEvidenceRetriever:
             _quota_manager.consume(1)
             logger.info(f"Retrieved {len(hits)} results for query: {query}")
             # Cache and persist
-            self._cache[cache_key] = hits
-            self._save_cache()
+            self._cache_put(cache_key, hits)
             return hits
             
         except requests.exceptions.RequestException as e:
@@ -144,14 +252,44 @@ class GoogleEvidenceRetriever:
             logger.error(f"Unexpected error in search: {e}")
             return []
 
+    def _get_http_client(self):
+        """Return the pooled async client, recreating it if the event loop changed."""
+        import asyncio as _asyncio
+        loop = _asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            old, old_loop = self._http, self._http_loop
+            if old is not None and old_loop.is_running() and not old_loop.is_closed():
+                # Still serving another thread: close the pool on its own loop
+                _asyncio.run_coroutine_threadsafe(old.aclose(), old_loop)
+            # A stopped loop can't run aclose(); its connections die with the loop
+            self._http = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_loop = None
+
     async def search_web_async(self, query: str, num_results: int = 10) -> List[Dict]:
         """Async version using httpx if available; falls back to sync in thread.
 
         Returns the same structure as search_web.
         """
         cache_key = f"async::{query}::{num_results}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
 
         if not _quota_manager.can_consume(1):
             logger.warning("Daily API quota reached. Skipping Google Custom Search call.")
@@ -168,10 +306,9 @@ class GoogleEvidenceRetriever:
         url = "https://www.googleapis.com/customsearch/v1"
         params = {"q": query, "key": self.api_key, "cx": self.cx, "num": min(num_results, 10)}
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                results = resp.json()
+            resp = await self._get_http_client().get(url, params=params)
+            resp.raise_for_status()
+            results = resp.json()
             hits: List[Dict] = []
             for item in results.get("items", []):
                 hits.append({
@@ -183,21 +320,23 @@ class GoogleEvidenceRetriever:
                 })
             _quota_manager.consume(1)
             logger.info(f"Retrieved {len(hits)} results for query: {query}")
-            self._cache[cache_key] = hits
-            self._save_cache()
+            self._cache_put(cache_key, hits)
             return hits
         except Exception as e:
             logger.error(f"Async Google Custom Search error: {e}")
             return []
     
-    def embed_text(self, text: str) -> Optional[List[float]]:
+    def embed_text(self, text: str) -> Optional[np.ndarray]:
         """Generate embedding for text using Gemini or fallback method.
         
+        Gemini embeddings are memoized per process, so repeated texts
+        (retries, the same claim across batches) skip the API round-trip.
+        
         Args:
             text: Text to embed
             
         Returns:
-            Embedding vector or None if failed
+            Read-only embedding vector or None if failed
         """
         if not text or len(text.strip()) == 0:
             return None
@@ -205,11 +344,7 @@ class GoogleEvidenceRetriever:
         try:
             if self._genai_client:
                 # Use Gemini text-embedding-004
-                resp = self._genai_client.models.embed_content(
-                    model="text-embedding-004",
-                    contents=text,
-                )
-                return resp.embeddings.values if hasattr(resp, "embeddings") else resp["embedding"]["values"]
+                return _embed_text_cached(self._genai_client, text)
             else:
                 # Fallback: simple TF-IDF like approach
                 return self._simple_embedding(text)
@@ -217,24 +352,187 @@ class GoogleEvidenceRetriever:
             logger.warning(f"Falling back to simple embedding: {e}")
             return self._simple_embedding(text)
 
+    def _embed_remote_batch(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Gemini embeddings for `texts`, or None if the client is unavailable or fails."""
+        if not self._genai_client:
+            return None
+        try:
+            resp = self._genai_client.models.embed_content(
+                model="text-embedding-004",
+                contents=texts,
+            )
+            return np.asarray([e.values for e in resp.embeddings], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Falling back to simple embeddings for batch: {e}")
+            return None
+
+    def _simple_embedding_batch(self, texts: List[str]) -> np.ndarray:
+        return np.vstack([self._simple_embedding(text) for text in texts])
+
+    def _embed_query_and_snippets(self, query: str, snippets: List[str]) -> np.ndarray:
+        """Embed the query (row 0) and snippets as unit-length float32 rows.
+
+        The query comes from the per-process embedding memo and only snippets
+        missing from the embedding matrix are sent to Gemini, in one batch.
+        If Gemini is unavailable, everything is embedded with the fallback
+        method and nothing is cached.
+        """
+        query_vec = None
+        if self._genai_client:
+            try:
+                query_vec = _embed_text_cached(self._genai_client, query)
+            except Exception as e:
+                logger.warning(f"Falling back to simple embeddings for batch: {e}")
+        if query_vec is not None:
+            with self._emb_lock:
+                missing = list(dict.fromkeys(s for s in snippets if s not in self._emb_index))
+            # The Gemini call runs outside the lock so concurrent reranks overlap
+            fresh = self._embed_remote_batch(missing) if missing else None
+            if not missing or fresh is not None:
+                with self._emb_lock:
+                    if missing:
+                        # Another rerank may have added some of these meanwhile
+                        new = [i for i, s in enumerate(missing) if s not in self._emb_index]
+                        if new:
+                            self._add_embeddings([missing[i] for i in new], fresh[new])
+                    if all(s in self._emb_index for s in snippets):
+                        rows = np.fromiter((self._emb_index[s] for s in snippets), dtype=np.intp, count=len(snippets))
+                        matrix = np.empty((len(snippets) + 1, query_vec.shape[0]), dtype=np.float32)
+                        matrix[0] = query_vec / max(float(np.linalg.norm(query_vec)), 1e-12)
+                        # Stored rows are already normalized; fancy indexing copies only the
+                        # needed float16 rows out of the (possibly mmapped) matrix, upcast here
+                        matrix[1:] = self._emb_matrix[rows]
+                        return matrix
+        return self._simple_embedding_batch([query] + snippets)
+
+    def _embeddings_keys_path(self) -> str:
+        return os.path.splitext(self.embeddings_path)[0] + ".keys.json"
+
+    def _load_embeddings(self):
+        """Load the matrix named by the keys file, which is the commit point of a flush."""
+        if not self._persist:
+            return None, []
+        try:
+            if os.path.exists(self._embeddings_keys_path()):
+                with open(self._embeddings_keys_path(), "rb") as f:
+                    manifest = _json_loads(f.read())
+                matrix_path = os.path.join(os.path.dirname(self.embeddings_path), manifest["matrix"])
+                keys = manifest["keys"]
+                matrix = np.load(matrix_path, mmap_mode="r")
+                if matrix.ndim == 2 and matrix.shape[0] == len(keys) and matrix.dtype == np.float16:
+                    self._emb_file = matrix_path
+                    self._prune_embedding_files(matrix_path)
+                    if len(keys) > _EMB_MAX_ENTRIES:
+                        matrix, keys = matrix[len(keys) - _EMB_MAX_ENTRIES:], keys[len(keys) - _EMB_MAX_ENTRIES:]
+                    return matrix, keys
+        except Exception as e:
+            logger.warning(f"Failed to load embedding cache: {e}")
+        self._prune_embedding_files(None)
+        return None, []
+
+    def _prune_embedding_files(self, keep: Optional[str]) -> None:
+        """Delete matrix files other than `keep` that no recent flush can still be committing."""
+        pattern = glob.escape(os.path.splitext(self.embeddings_path)[0]) + ".*.npy"
+        cutoff = time.time() - _EMB_ORPHAN_GRACE_SECONDS
+        for path in glob.glob(pattern):
+            if keep and os.path.samefile(path, keep):
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _save_embeddings(self) -> None:
+        """Write the matrix to a new file, then atomically point the keys file at it.
+
+        Each flush writes a uniquely named matrix and swaps in the keys file
+        with os.replace, so readers (including other workers) always see a
+        matrix and key list from the same flush.
+        """
+        if not self._persist:
+            return
+        base = os.path.splitext(self.embeddings_path)[0]
+        matrix_path = f"{base}.{uuid.uuid4().hex[:12]}.npy"
+        keys_tmp = f"{self._embeddings_keys_path()}.{os.getpid()}.tmp"
+        try:
+            np.save(matrix_path, self._emb_matrix[:len(self._emb_keys)])
+            with open(keys_tmp, "wb") as f:
+                f.write(_json_dumps({"matrix": os.path.basename(matrix_path), "keys": self._emb_keys}))
+            os.replace(keys_tmp, self._embeddings_keys_path())
+        except Exception as e:
+            logger.warning(f"Failed to persist embedding cache: {e}")
+            for path in (matrix_path, keys_tmp):
+                if os.path.exists(path):
+                    os.remove(path)
+            return
+        # The previous matrix is no longer referenced by this process's keys file
+        previous, self._emb_file = self._emb_file, matrix_path
+        if previous:
+            try:
+                os.remove(previous)
+            except OSError:
+                pass
+        self._prune_embedding_files(matrix_path)
+
+    def flush_embeddings(self) -> None:
+        """Persist new embedding rows, if any (also runs at exit)."""
+        with self._emb_lock:
+            if self._emb_dirty:
+                self._save_embeddings()
+                self._emb_dirty = False
+            self._emb_last_flush = time.monotonic()
+
+    def _add_embeddings(self, keys: List[str], vectors: np.ndarray) -> None:
+        if len(keys) > _EMB_MAX_ENTRIES:
+            keys, vectors = keys[-_EMB_MAX_ENTRIES:], vectors[-_EMB_MAX_ENTRIES:]
+        count = len(self._emb_keys)
+        if self._emb_matrix is not None and self._emb_matrix.shape[1] != vectors.shape[1]:
+            # Embedding model changed dimensionality; start over
+            self._emb_matrix, self._emb_keys, self._emb_index, count = None, [], {}, 0
+        if count + len(keys) > _EMB_MAX_ENTRIES:
+            # Drop the oldest rows, a quarter of the cap at a time so the shift is amortized
+            drop = min(count, max(count + len(keys) - _EMB_MAX_ENTRIES, _EMB_MAX_ENTRIES // 4))
+            kept = np.array(self._emb_matrix[drop:count])
+            self._emb_matrix = None if count == drop else kept
+            self._emb_keys = self._emb_keys[drop:]
+            self._emb_index = {key: row for row, key in enumerate(self._emb_keys)}
+            count -= drop
+
+        capacity = 0 if self._emb_matrix is None else self._emb_matrix.shape[0]
+        needed = count + len(keys)
+        if needed > capacity or not self._emb_matrix.flags.writeable:
+            # Grow geometrically so appends are amortized O(1); also moves an
+            # mmapped (read-only) matrix into memory on first insert
+            grown = np.empty((max(needed, 2 * capacity, 64), vectors.shape[1]), dtype=np.float16)
+            if count:
+                grown[:count] = self._emb_matrix[:count]
+            self._emb_matrix = grown
+
+        # Normalize once at insert (in float32) and store half precision
+        vectors = np.asarray(vectors, dtype=np.float32)
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+        self._emb_matrix[count:needed] = vectors.astype(np.float16)
+        for offset, key in enumerate(keys):
+            self._emb_index[key] = count + offset
+        self._emb_keys.extend(keys)
+        # Rewriting the matrix is O(N); batch new rows into periodic flushes
+        self._emb_dirty = True
+        if time.monotonic() - self._emb_last_flush >= self._emb_flush_interval:
+            self._save_embeddings()
+            self._emb_dirty = False
+            self._emb_last_flush = time.monotonic()
+
+    def _simple_embedding(self, text: str) -> np.ndarray:
+        """Simple fallback embedding using hashed word counts.
+
+        Words are hashed into a fixed number of buckets, so every text maps
+        to the same dimensionality and vectors are directly comparable.
+        The returned vector is memoized and read-only.
+        """
+        return _simple_embedding_cached(text)
     
-    def _simple_embedding(self, text: str) -> List[float]:
-        """Simple fallback embedding method using word frequency."""
-        import re
-        from collections import Counter
-        
-        # Simple text preprocessing
-        words = re.findall(r'\b\w+\b', text.lower())
-        word_freq = Counter(words)
-        
-        # Create a simple vector (this is a basic fallback)
-        # In production, you'd want a proper embedding model
-        max_freq = max(word_freq.values()) if word_freq else 1
-        vector = [word_freq.get(word, 0) / max_freq for word in sorted(word_freq.keys())]
-        
-        return vector if vector else [0.0]
-    
-    def calculate_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def calculate_similarity(self, vec1, vec2) -> float:
         """Calculate cosine similarity between two vectors.
         
         Args:
@@ -242,90 +540,105 @@ class GoogleEvidenceRetriever:
             vec2: Second vector
             
         Returns:
-            Similarity score between 0 and 1
+            Similarity score between 0 and 1; 0 for vectors from different
+            embedding spaces (mismatched dimensions)
         """
-        if not vec1 or not vec2:
+        if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec2) == 0:
             return 0.0
-            
-        # Pad vectors to same length if needed
-        max_len = max(len(vec1), len(vec2))
-        vec1_padded = vec1 + [0.0] * (max_len - len(vec1))
-        vec2_padded = vec2 + [0.0] * (max_len - len(vec2))
-        
+
         try:
-            # Calculate cosine similarity
-            dot_product = sum(a * b for a, b in zip(vec1_padded, vec2_padded))
-            norm1 = np.linalg.norm(vec1_padded)
-            norm2 = np.linalg.norm(vec2_padded)
-            
+            a = np.asarray(vec1, dtype=np.float32)
+            b = np.asarray(vec2, dtype=np.float32)
+            if a.shape != b.shape:
+                return 0.0
+
+            norm1 = np.linalg.norm(a)
+            norm2 = np.linalg.norm(b)
             if norm1 == 0 or norm2 == 0:
                 return 0.0
-                
-            return dot_product / (norm1 * norm2)
+
+            if _HAS_SIMSIMD:
+                return 1.0 - float(simsimd.cosine(a, b))
+            return float(np.dot(a, b) / (norm1 * norm2))
         except Exception as e:
             logger.error(f"Error calculating similarity: {e}")
             return 0.0
     
-def rerank(self, query: str, docs: List[Dict]) -> List[Dict]:
-    if not docs:
-        return []
-
-    query_embedding = self.embed_text(query)
-    if not query_embedding:
-        return docs
-
-    scored = []
-
-    domain_boosts = {
-        ".gov": 0.08,
-        ".edu": 0.06,
-        ".org": 0.02,
-    }
-
-    def dtype_boost(link: str) -> float:
-        link = (link or "").lower()
-        b = 0.0
-        if link.endswith(".pdf"):
-            b += 0.02
-        if "wikipedia.org" in link:
-            b += 0.01
-        return b
-
-    seen_links = set()
-    for doc in docs:
-        link = doc.get("link")
-        if not link or link in seen_links:
-            continue
-        seen_links.add(link)
-
-        doc_embedding = self.embed_text(doc.get("snippet", ""))
-        if doc_embedding:
-            similarity = self.calculate_similarity(query_embedding, doc_embedding)
-            if similarity < 0.3:
-                continue  # filter out low similarity
-
-            display_link = (doc.get("display_link") or link).lower()
-            prior = 0.0
-            for suffix, boost in domain_boosts.items():
-                if suffix in display_link:
-                    prior = max(prior, boost)
-
-            db = dtype_boost(link)
-            scored.append((similarity + prior + db, doc))
-        else:
-            scored.append((0.0, doc))
+    def rerank(self, query: str, docs: List[Dict]) -> List[Dict]:
+        """Re-rank search results by semantic similarity plus source priors.
+        
+        Args:
+            query: Search query the results were retrieved for
+            docs: Search results from search_web
+            
+        Returns:
+            Deduplicated results above the similarity threshold, best first,
+            each with a similarity_score
+        """
+        if not docs:
+            return []
 
-    scored.sort(key=lambda x: x[0], reverse=True)
+        if not query or not query.strip():
+            return docs
+
+        def source_prior(doc: Dict) -> float:
+            link = (doc.get("link") or "").lower()
+            return _domain_boost(doc.get("display_link") or link) + _dtype_boost(link)
+
+        # Deduplicate by link before paying for any embeddings
+        unique_docs = []
+        seen_links = set()
+        for doc in docs:
+            link = doc.get("link")
+            if not link or link in seen_links:
+                continue
+            seen_links.add(link)
+            unique_docs.append(doc)
+
+        # Docs without a snippet can't be embedded; they keep a neutral 0.0 score
+        embeddable = [i for i, doc in enumerate(unique_docs) if (doc.get("snippet") or "").strip()]
+
+        similarities = np.zeros(0, dtype=np.float32)
+        if embeddable:
+            # Identical snippets (mirrors, syndicated copies) are embedded once
+            unique_snippets: Dict[str, int] = {}
+            inverse = np.fromiter(
+                (unique_snippets.setdefault(unique_docs[i]["snippet"], len(unique_snippets)) for i in embeddable),
+                dtype=np.intp,
+                count=len(embeddable),
+            )
+            # Query is row 0; snippet rows come from the embedding cache where possible.
+            # Rows are unit length, so cosine similarity is a plain dot product
+            matrix = self._embed_query_and_snippets(query, list(unique_snippets))
+            if _HAS_SIMSIMD:
+                # "inner" yields the dot product for every (query, snippet) pair
+                similarities = np.asarray(simsimd.cdist(matrix[:1], matrix[1:], metric="inner"), dtype=np.float32)[0]
+            else:
+                similarities = matrix[1:] @ matrix[0]
+            similarities = similarities[inverse]
 
-    reranked = []
-    for score, doc in scored:
-        doc_with_score = doc.copy()
-        doc_with_score["similarity_score"] = round(score, 4)
-        reranked.append(doc_with_score)
+        priors = np.fromiter((source_prior(unique_docs[i]) for i in embeddable), dtype=np.float32, count=len(embeddable))
+
+        scores = np.zeros(len(unique_docs), dtype=np.float32)
+        keep = np.ones(len(unique_docs), dtype=bool)
+        if embeddable:
+            scores[embeddable] = similarities + priors
+            keep[embeddable] = similarities >= 0.3  # filter out low similarity
+
+        candidates = np.flatnonzero(keep)
+        # Stable descending sort keeps search order for ties
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        # Scores are attached in place: hits are only shared through the
+        # per-query search cache, where they always get the same score
+        rounded = np.round(scores.astype(np.float64), 4).tolist()
+        reranked = [unique_docs[i] for i in order]
+        for i, doc in zip(order.tolist(), reranked):
+            doc["similarity_score"] = rounded[i]
+
+        logger.info(f"Re-ranked {len(reranked)} documents after filtering and deduplication")
+        return reranked
 
-    logger.info(f"Re-ranked {len(reranked)} documents after filtering and deduplication")
-    return reranked
-    
     def retrieve_evidence(
         self, 
         query: str, 
@@ -371,7 +684,9 @@ def rerank(self, query: str, docs: List[Dict]) -> List[Dict]:
         if not hits:
             logger.warning("No search results found (async)")
             return []
-        reranked = self.rerank(query, hits)
+        # rerank makes blocking Gemini embedding calls; keep them off the event loop
+        import asyncio as _asyncio
+        reranked = await _asyncio.to_thread(self.rerank, query, hits)
         return reranked[:top_k]
     
     def batch_retrieve(self, queries: List[str], top_k: int = 3) -> Dict[str, List[Dict]]:
@@ -395,62 +710,123 @@ def rerank(self, query: str, docs: List[Dict]) -> List[Dict]:
         
         return results
 
+    async def batch_retrieve_async(self, queries: List[str], top_k: int = 3) -> Dict[str, List[Dict]]:
+        """Retrieve evidence for multiple queries concurrently.
 
-class _DailyQuotaManager:
-    """Simple file-backed daily quota manager.
+        All searches share the pooled async HTTP client, so wall time is
+        roughly one round-trip rather than one per query. At most
+        GCP_MAX_CONCURRENCY (default 8) queries are in flight at once to
+        avoid bursting past the Custom Search QPS limit.
+
+        Args:
+            queries: List of search queries
+            top_k: Number of top results per query
+
+        Returns:
+            Dictionary mapping queries to evidence lists
+        """
+        import asyncio as _asyncio
+        sem = _asyncio.Semaphore(int(os.getenv("GCP_MAX_CONCURRENCY", "8")))
 
-    - Uses env GCP_DAILY_QUERY_LIMIT (default 100)
-    - Stores counts in logs/.google_quota.json
-    - Resets automatically when date changes
+        async def _bounded(query: str) -> List[Dict]:
+            async with sem:
+                return await self.retrieve_evidence_async(query, top_k=top_k)
+
+        evidence_lists = await _asyncio.gather(
+            *(_bounded(query) for query in queries),
+            return_exceptions=True,
+        )
+        results = {}
+        for query, evidence in zip(queries, evidence_lists):
+            if isinstance(evidence, BaseException):
+                logger.error(f"Error retrieving evidence for query '{query}': {evidence}")
+                evidence = []
+            results[query] = evidence
+        return results
+
+
+class _DailyQuotaManager:
+    """Token-bucket daily quota manager with batched disk flushes.
+
+    - Uses env GCP_DAILY_QUERY_LIMIT (default 100) as both the bucket size
+      and the number of tokens refilled per day (limit / 86400 per second)
+    - Also counts queries per UTC day: a full bucket plus a day of refill
+      would otherwise allow up to twice the limit in 24 hours
+    - Stores tokens, last refill time and today's usage in logs/.google_quota.json
+    - Flushes state at most every GCP_QUOTA_FLUSH_SECONDS (default 5) and at exit
+    - Keeps state in memory only when GCP_DISABLE_DISK_CACHE=1
     """
 
     def __init__(self) -> None:
         self.limit = int(os.getenv("GCP_DAILY_QUERY_LIMIT", "100"))
+        self.rate = self.limit / 86400.0
+        self.flush_interval = float(os.getenv("GCP_QUOTA_FLUSH_SECONDS", "5"))
         self.store_path = os.getenv("GCP_QUOTA_STORE", os.path.join("logs", ".google_quota.json"))
-        os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
+        self._persist = os.getenv("GCP_DISABLE_DISK_CACHE") != "1"
+        if self._persist:
+            os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
         self.state = self._load_state()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        if self._persist:
+            atexit.register(self._flush)
 
-    def _today_str(self) -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    def _load_state(self) -> Dict[str, int]:
+    def _load_state(self) -> Dict[str, Any]:
         try:
-            if os.path.exists(self.store_path):
-                with open(self.store_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            if self._persist and os.path.exists(self.store_path):
+                with open(self.store_path, "rb") as f:
+                    data = _json_loads(f.read())
             else:
                 data = {}
         except Exception:
             data = {}
-        # Reset count if date changed
-        today = self._today_str()
-        if data.get("date") != today:
-            data = {"date": today, "used": 0}
-        return data
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        used = int(data.get("used", 0)) if data.get("date") == today else 0
+        if "tokens" in data and "last_refill" in data:
+            return {"tokens": float(data["tokens"]), "last_refill": float(data["last_refill"]), "date": today, "used": used}
+        # Fresh store, or the old {"date", "used"} format: start from what is left today
+        return {"tokens": float(max(self.limit - used, 0)), "last_refill": time.time(), "date": today, "used": used}
 
     def _save_state(self) -> None:
+        if not self._persist:
+            return
         try:
-            with open(self.store_path, "w", encoding="utf-8") as f:
-                json.dump(self.state, f)
+            with open(self.store_path, "wb") as f:
+                f.write(_json_dumps(self.state))
         except Exception as e:
             logger.warning(f"Failed to persist quota state: {e}")
 
+    def _flush(self) -> None:
+        if self._dirty:
+            self._save_state()
+            self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.time()
+        elapsed = max(now - self.state["last_refill"], 0.0)
+        self.state["tokens"] = min(float(self.limit), self.state["tokens"] + elapsed * self.rate)
+        self.state["last_refill"] = now
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if self.state["date"] != today:
+            self.state["date"] = today
+            self.state["used"] = 0
+
     def can_consume(self, amount: int) -> bool:
         if self.limit <= 0:
             return True
-        today = self._today_str()
-        if self.state.get("date") != today:
-            self.state = {"date": today, "used": 0}
-        return (self.state.get("used", 0) + amount) <= self.limit
+        self._refill()
+        return self.state["tokens"] >= amount and self.state["used"] + amount <= self.limit
 
     def consume(self, amount: int) -> None:
         if self.limit <= 0:
             return
-        today = self._today_str()
-        if self.state.get("date") != today:
-            self.state = {"date": today, "used": 0}
-        self.state["used"] = int(self.state.get("used", 0)) + int(amount)
-        self._save_state()
+        self._refill()
+        self.state["tokens"] = max(self.state["tokens"] - amount, 0.0)
+        self.state["used"] += amount
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush()
 
 
 _quota_manager = _DailyQuotaManager()
@@ -459,8 +835,8 @@ _quota_manager = _DailyQuotaManager()
 def _safe_read_json(path: str) -> Dict:
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                return _json_loads(f.read())
     except Exception:
         return {}
     return {}
@@ -474,22 +850,94 @@ def _maybe_reset_cache(cache: Dict) -> Dict:
     return cache
 
     # Methods bound to instance
-def GoogleEvidenceRetriever__load_cache(self) -> Dict:
+def GoogleEvidenceRetriever__load_cache(self) -> "OrderedDict[str, List[Dict]]":
+    """Load today's snapshot, then replay today's entries from the append-only log."""
+    self._cache_writes = 0
+    if not self._persist:
+        return OrderedDict()
     raw = _safe_read_json(self.cache_path)
     raw = _maybe_reset_cache(raw or {})
-    return raw.get("data", {})
+    cache: "OrderedDict[str, List[Dict]]" = OrderedDict(raw.get("data", {}))
+    today = _today()
+    try:
+        if os.path.exists(self.cache_log_path):
+            with open(self.cache_log_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = _json_loads(line)
+                    except ValueError:
+                        continue  # torn write from an interrupted append
+                    if entry.get("d") != today:
+                        continue
+                    cache[entry["k"]] = entry["v"]
+                    cache.move_to_end(entry["k"])
+                    self._cache_writes += 1
+    except Exception as e:
+        logger.warning(f"Failed to replay search cache log: {e}")
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return cache
 
-def GoogleEvidenceRetriever__save_cache(self) -> None:
+def GoogleEvidenceRetriever__save_cache(self, key: str, hits: List[Dict]) -> None:
+    """Append one entry to the cache log; compact into the snapshot every so often."""
+    if not self._persist:
+        return
     try:
-        payload = {"date": _today(), "data": self._cache}
-        with open(self.cache_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
+        with open(self.cache_log_path, "ab") as f:
+            f.write(_json_dumps({"d": _today(), "k": key, "v": hits}) + b"\n")
+        self._cache_writes += 1
+        if self._cache_writes >= _CACHE_COMPACT_EVERY:
+            self._compact_cache()
     except Exception as e:
         logger.warning(f"Failed to persist search cache: {e}")
 
+def GoogleEvidenceRetriever__compact_cache(self) -> None:
+    payload = {"date": _today(), "data": self._cache}
+    with open(self.cache_path, "wb") as f:
+        f.write(_json_dumps(payload))
+    # Snapshot now covers everything in the log
+    open(self.cache_log_path, "w").close()
+    self._cache_writes = 0
+
+def GoogleEvidenceRetriever__cache_put(self, key: str, hits: List[Dict]) -> None:
+    self._cache[key] = hits
+    self._cache.move_to_end(key)
+    while len(self._cache) > _CACHE_MAX_ENTRIES:
+        self._cache.popitem(last=False)
+    self._save_cache(key, hits)
+
 # Bind helpers to class to avoid cluttering global namespace
 setattr(GoogleEvidenceRetriever, "_load_cache", GoogleEvidenceRetriever__load_cache)
 setattr(GoogleEvidenceRetriever, "_save_cache", GoogleEvidenceRetriever__save_cache)
+setattr(GoogleEvidenceRetriever, "_compact_cache", GoogleEvidenceRetriever__compact_cache)
+setattr(GoogleEvidenceRetriever, "_cache_put", GoogleEvidenceRetriever__cache_put)
+
+
+@lru_cache(maxsize=8192)
+def _simple_embedding_cached(text: str) -> np.ndarray:
+    ids = np.fromiter(
+        (zlib.crc32(word.encode("utf-8")) & (SIMPLE_EMBEDDING_DIM - 1) for word in _TOKEN_RE.findall(text.lower())),
+        dtype=np.int64,
+    )
+    vector = np.bincount(ids, minlength=SIMPLE_EMBEDDING_DIM).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    vector.flags.writeable = False
+    return vector
+
+
+@lru_cache(maxsize=4096)
+def _embed_text_cached(client, text: str) -> np.ndarray:
+    """Gemini embedding for `text`, memoized per client; failures are not cached."""
+    resp = client.models.embed_content(
+        model="text-embedding-004",
+        contents=text,
+    )
+    vec = np.asarray(resp.embeddings[0].values, dtype=np.float32)
+    # Shared between callers, so make sure nobody normalizes it in place
+    vec.flags.writeable = False
+    return vec
 
 
 # Convenience function for easy integration
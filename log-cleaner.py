@@ -2,25 +2,30 @@ import os
 
 def clean_log_file(log_path, filter_keyword):
     """Reads a log file, filters out lines containing a specific keyword,
-    and writes the cleaned content back to the file.
+    and atomically replaces the file with the cleaned content.
     """
     if not os.path.exists(log_path):
         print(f"Error: Log file not found at {log_path}")
         return
 
+    tmp_path = log_path + ".tmp"
+    keyword = filter_keyword.encode('utf-8')
+    removed = 0
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # Stream in binary so lines are never decoded; only one line is in memory at a time
+        with open(log_path, 'rb', buffering=1 << 20) as fin, open(tmp_path, 'wb', buffering=1 << 20) as fout:
+            for line in fin:
+                if keyword in line:
+                    removed += 1
+                else:
+                    fout.write(line)
 
-        # Filter out the unwanted lines
-        cleaned_lines = [line for line in lines if filter_keyword not in line]
-
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.writelines(cleaned_lines)
-
-        print(f"Successfully cleaned {log_path}. Removed {len(lines) - len(cleaned_lines)} lines.")
+        os.replace(tmp_path, log_path)
+        print(f"Successfully cleaned {log_path}. Removed {removed} lines.")
 
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         print(f"An error occurred: {e}")
 
 if __name__ == "__main__":
@@ -1,73 +1,153 @@
 import uvicorn
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 import os
+import sys
+import orjson
 from dotenv import load_dotenv
 
+from utils.logging import setup_logging, flush_logging, get_logger
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/app.log')
-    ]
-)
+# Configure logging once (console + buffered, rotating file); this also
+# creates logs/, so it works under any server, not only `python main.py`
+setup_logging(log_file_path="logs/app.log", level=os.getenv("LOG_LEVEL", "INFO"))
+
+logger = get_logger(__name__)
+
+DEBUG = os.getenv("DEBUG", "true").lower() == "true"
 
-logger = logging.getLogger(__name__)
+# Per-request access logging is costly on cheap endpoints such as /health;
+# only keep it in debug. Uvicorn's error log is unaffected.
+if not DEBUG:
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+async def _warm_llm():
+    """Build the shared LLM client (and optionally open its connection) off the request path."""
+    from utils.models import get_default_llm
+    try:
+        llm = await asyncio.get_running_loop().run_in_executor(None, get_default_llm)
+        # A real call opens the HTTPS connection but costs quota, so it is opt-in
+        if os.getenv("LLM_WARMUP_PING", "false").lower() == "true":
+            await llm.ainvoke("ping")
+        logger.info("LLM client warmed up")
+    except Exception as e:
+        logger.warning(f"LLM warmup skipped: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Serve repeated prompts from the LLM response cache
+    from utils.llm_cache import setup_llm_caching
+    setup_llm_caching()
+    # Warm the LLM client in the background so the first fact-check is not slower
+    app.state.llm_warmup = asyncio.create_task(_warm_llm())
+    try:
+        yield
+    finally:
+        app.state.llm_warmup.cancel()
+        # Release pooled search connections, then write out buffered log records
+        from Claim_Verification.nodes.retrieve_evidence import close_retriever
+        await close_retriever()
+        flush_logging()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Athena Misinformation Verifier API",
     description="API for verifying misinformation claims using AI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
-# CORS Middleware
+def _env_list(name: str, default: str) -> List[str]:
+    return [item.strip() for item in os.getenv(name, default).split(",") if item.strip()]
+
+# CORS Middleware; explicit methods/headers avoid Starlette's wildcard echo path,
+# and credentials are opt-in (they are invalid with a "*" origin anyway)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_env_list("ALLOWED_ORIGINS", "*"),  # In production, set specific origins
+    allow_credentials=os.getenv("CORS_ALLOW_CREDENTIALS", "false").lower() == "true",
+    allow_methods=_env_list("ALLOWED_METHODS", "GET,POST"),
+    allow_headers=_env_list("ALLOWED_HEADERS", "content-type,authorization"),
 )
 
-# Mount static files for frontend
-app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
+# Compress larger JSON responses (evidence text can run to many KB)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+class CachedStatic(StaticFiles):
+    """StaticFiles that lets browsers keep built frontend assets."""
+
+    cache_control = os.getenv("STATIC_CACHE_CONTROL", "public, max-age=31536000, immutable")
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", self.cache_control)
+        return response
+
+# Mount static files for frontend (the build output may not exist yet at startup)
+app.mount("/static", CachedStatic(directory="frontend/static", check_dir=False), name="static")
+
+# Static bodies for the cheap endpoints, encoded once and reused per request
+def _json_response(payload: Dict[str, Any]) -> Response:
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+_HEALTH_RESPONSE = _json_response({"status": "healthy", "version": "1.0.0"})
+_ROOT_RESPONSE = _json_response({
+    "message": "Welcome to Athena Misinformation Verifier API",
+    "docs": "/docs",
+    "redoc": "/redoc"
+})
 
 # Health check endpoint
-@app.get("/health")
+@app.get("/health", response_class=Response)
 async def health_check():
     """Health check endpoint for monitoring"""
-    return {"status": "healthy", "version": "1.0.0"}
+    return _HEALTH_RESPONSE
 
 # Root endpoint
-@app.get("/")
+@app.get("/", response_class=Response)
 async def root():
-    return {
-        "message": "Welcome to Athena Misinformation Verifier API",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return _ROOT_RESPONSE
 
 # Import and include routers
 from fact_checker.agent import router as fact_checker_router
 app.include_router(fact_checker_router, prefix="/api/fact-check", tags=["Fact Checking"])
 
 if __name__ == "__main__":
-    # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
-    
-    # Run the FastAPI application
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", 8000))
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+    if os.getenv("SERVER", "uvicorn") == "gunicorn":
+        # Production on POSIX: gunicorn supervises WEB_CONCURRENCY uvicorn workers.
+        # execvp replaces this process, so flush buffered logs first.
+        flush_logging()
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(workers),
+            "-b", f"{host}:{port}",
+            "main:app",
+        ])
+
+    # Run the FastAPI application on libuv + httptools (uvicorn[standard]);
+    # uvloop has no Windows build. Reload and multiple workers are exclusive.
     uvicorn.run(
         "main:app",
-        host=os.getenv("HOST", "0.0.0.0"),
-        port=int(os.getenv("PORT", 8000)),
-        reload=os.getenv("DEBUG", "true").lower() == "true"
+        host=host,
+        port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=DEBUG,
+        workers=None if DEBUG else workers,
+        access_log=DEBUG,
     )
@@ -1,3 +1,5 @@
+import importlib
+
 __all__ = [
     # LLM utilities
     "call_llm_with_structured_output",
@@ -5,6 +7,9 @@ __all__ = [
     # LLM models
     "get_llm",
     "get_default_llm",
+    "invalidate_llm_cache",
+    # LLM response cache
+    "setup_llm_caching",
     # Settings
     "settings",
     # Text utilities
@@ -15,33 +20,34 @@ __all__ = [
     # Logging helpers
     "setup_logging",
     "get_logger",
+    "flush_logging",
 ]
 
 
+# Lazily imported exports: name -> (module, attribute)
+_LAZY = {
+    "call_llm_with_structured_output": ("utils.llm", "call_llm_with_structured_output"),
+    "process_with_voting": ("utils.llm", "process_with_voting"),
+    "truncate_evidence_for_token_limit": ("utils.llm", "truncate_evidence_for_token_limit"),
+    "estimate_token_count": ("utils.llm", "estimate_token_count"),
+    "get_llm": ("utils.models", "get_llm"),
+    "get_default_llm": ("utils.models", "get_default_llm"),
+    "invalidate_llm_cache": ("utils.models", "invalidate_llm_cache"),
+    "setup_llm_caching": ("utils.llm_cache", "setup_llm_caching"),
+    "settings": ("utils.settings", "settings"),
+    "remove_following_sentences": ("utils.text", "remove_following_sentences"),
+    "setup_logging": ("utils.logging", "setup_logging"),
+    "get_logger": ("utils.logging", "get_logger"),
+    "flush_logging": ("utils.logging", "flush_logging"),
+}
+
+
 def __getattr__(name):
-    if name in ("call_llm_with_structured_output", "process_with_voting", "truncate_evidence_for_token_limit", "estimate_token_count"):
-        from .llm import (
-            call_llm_with_structured_output,
-            process_with_voting,
-            truncate_evidence_for_token_limit,
-            estimate_token_count,
-        )
-        return {
-            "call_llm_with_structured_output": call_llm_with_structured_output,
-            "process_with_voting": process_with_voting,
-            "truncate_evidence_for_token_limit": truncate_evidence_for_token_limit,
-            "estimate_token_count": estimate_token_count,
-        }[name]
-    if name in ("get_llm", "get_default_llm"):
-        from .models import get_llm, get_default_llm
-        return {"get_llm": get_llm, "get_default_llm": get_default_llm}[name]
-    if name == "settings":
-        from .settings import settings
-        return settings
-    if name == "remove_following_sentences":
-        from .text import remove_following_sentences
-        return remove_following_sentences
-    if name in ("setup_logging", "get_logger"):
-        from .logging import setup_logging, get_logger
-        return {"setup_logging": setup_logging, "get_logger": get_logger}[name]
-    raise AttributeError(name)
\ No newline at end of file
+    try:
+        module_path, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    value = getattr(importlib.import_module(module_path), attr)
+    # Cache on the package so later lookups never reach __getattr__
+    globals()[name] = value
+    return value
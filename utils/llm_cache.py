@@ -0,0 +1,45 @@
+"""LLM response caching.
+
+Installs a process-wide, exact-match LangChain LLM cache so repeated
+deterministic prompts (the same claim checked twice, retries) skip the
+Gemini call entirely.
+"""
+
+import logging
+import os
+
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+
+logger = logging.getLogger(__name__)
+
+
+def setup_llm_caching() -> None:
+    """Install the global LLM cache once.
+
+    The cache is exact-match only: verification prompts that differ in a
+    single number must not share a verdict. Clients sampling at a non-zero
+    temperature opt out (see `get_llm`).
+
+    - With REDIS_URL set (and langchain-community installed), uses Redis so
+      the cache is shared between workers.
+    - Otherwise uses an in-memory cache.
+    """
+    if get_llm_cache() is not None:
+        return
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            import redis  # type: ignore
+            from langchain_community.cache import RedisCache  # type: ignore
+
+            ttl = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+            set_llm_cache(RedisCache(redis.Redis.from_url(redis_url), ttl=ttl))
+            logger.info("LLM cache enabled (Redis)")
+            return
+        except Exception as e:
+            logger.warning(f"Redis LLM cache unavailable, using in-memory cache: {e}")
+
+    set_llm_cache(InMemoryCache(maxsize=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))))
+    logger.info("LLM in-memory cache enabled")
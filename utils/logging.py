@@ -1,9 +1,21 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import time
 from typing import Optional
 import json
 
+try:
+    # orjson is optional; structured log payloads fall back to stdlib json
+    import orjson  # type: ignore
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except Exception:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
 try:
     # Rich is optional; if not installed, we fall back to standard logging
     from rich.logging import RichHandler  # type: ignore
@@ -13,6 +25,90 @@ except Exception:
     _HAS_RICH = False
 
 
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that tracks the file size in memory.
+
+    The stock handler seeks the stream (and stats the path) on every record
+    to decide on rollover; here the size is advanced by the length of each
+    written record and re-read from disk at most every `sync_interval`
+    seconds, or when the estimate reaches maxBytes. Re-reading picks up
+    records from other worker processes sharing the file, and a changed
+    inode (another worker rotated it) reopens the stream on the new file.
+    """
+
+    sync_interval = 1.0
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._approx_size = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = super()._open()
+        try:
+            self._approx_size = os.fstat(stream.fileno()).st_size
+        except OSError:
+            self._approx_size = 0
+        self._last_sync = time.monotonic()
+        return stream
+
+    def _sync_size(self) -> None:
+        """Refresh the size from disk, reopening if the file was rotated elsewhere."""
+        self._last_sync = time.monotonic()
+        try:
+            ours = os.fstat(self.stream.fileno())
+            current = os.stat(self.baseFilename)
+        except OSError:
+            current = None
+        if current is None or (current.st_dev, current.st_ino) != (ours.st_dev, ours.st_ino):
+            self.stream.close()
+            self.stream = self._open()
+        else:
+            self._approx_size = current.st_size
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:  # delay=True: open on first record
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        self._pending = len(self.format(record)) + len(self.terminator)
+        if (
+            self._approx_size + self._pending >= self.maxBytes
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self._sync_size()
+        return self._approx_size + self._pending >= self.maxBytes
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._approx_size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        self._approx_size += self._pending
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes when `flush_interval` seconds have passed.
+
+    The interval is checked as records arrive, so an idle buffer is written
+    on the next record, on ERROR, or at shutdown.
+    """
+
+    def __init__(self, capacity: int, flushLevel: int, target: logging.Handler, flush_interval: float) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
 def setup_logging(
     *,
     level: int | str = logging.INFO,
@@ -20,11 +116,16 @@ def setup_logging(
     enable_console: bool = True,
     rotate_max_bytes: int = 10 * 1024 * 1024,
     rotate_backup_count: int = 5,
+    buffer_capacity: int = 1000,
+    flush_interval: float = 30.0,
 ) -> None:
     """Configure root logger once with optional colored console and rotating file.
 
     - If `rich` is available, console logs are pretty with levels and time.
     - Keeps file rotation and UTF-8 encoding.
+    - File writes are buffered (up to `buffer_capacity` records, flushed on
+      ERROR or every `flush_interval` seconds); call `flush_logging()` to
+      force them out.
     - Idempotent: re-calling will not duplicate handlers.
     """
 
@@ -50,14 +151,23 @@ def setup_logging(
     )
 
     if log_file_path:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file_path,
             maxBytes=rotate_max_bytes,
             backupCount=rotate_backup_count,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(
+            _TimedMemoryHandler(
+                buffer_capacity,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flush_interval=flush_interval,
+            )
+        )
+        atexit.register(flush_logging)
 
     if enable_console:
         if _HAS_RICH and RichHandler is not None:
@@ -84,6 +194,12 @@ def setup_logging(
     setattr(root_logger, "_configured_by_utils_setup", True)
 
 
+def flush_logging() -> None:
+    """Write out any buffered log records."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a module-specific logger."""
     return logging.getLogger(name if name else __name__)
@@ -91,10 +207,12 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 
 def log_kv(logger: logging.Logger, level: int, phase: str, **kwargs) -> None:
     """Structured logging helper: phase plus key-values."""
+    # Skip serialization entirely when the record would be filtered out
+    if not logger.isEnabledFor(level):
+        return
     try:
-        payload = {"phase": phase, **kwargs}
-        logger.log(level, json.dumps(payload, default=str))
+        logger.log(level, _dumps({"phase": phase, **kwargs}))
     except Exception:
-        logger.log(level, f"{phase} | {kwargs}")
+        logger.log(level, "%s | %s", phase, kwargs)
 
 
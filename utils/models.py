@@ -3,13 +3,27 @@
 Provides access to configured language model instances for all modules.
 """
 
-from langchain_core.language_models.chat_models import BaseChatModel
-#from langchain_google_vertexai import ChatVertexAI
-from langchain_google_genai import ChatGoogleGenerativeAI
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from utils.settings import settings
 
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+# Read once at import; settings are not reloaded at runtime
+_API_KEY = settings.gemini_api_key
+
+# Client options shared by every model; kept out of get_llm's cache key
+_LLM_KW = {
+    "max_retries": settings.llm_max_retries,
+    "timeout": settings.llm_timeout,
+}
+
 
+@lru_cache(maxsize=32)
 def get_llm(
     model_name: str = "gemini-2.5-flash-lite",
     temperature: float = 0.0,
@@ -17,6 +31,9 @@ def get_llm(
 ) -> BaseChatModel:
     """Get LLM with specified configuration.
 
+    Instances are cached per argument combination and shared between
+    callers, so the client and its HTTP session are built only once.
+
     Args:
         model_name: The model to use
         temperature: Temperature for generation
@@ -29,20 +46,31 @@ def get_llm(
     if completions > 1 and temperature == 0.0:
         temperature = 0.2
 
+    # Imported on first use: pulls in the Gemini SDK, which is slow to load
+    #from langchain_google_vertexai import ChatVertexAI
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     # Use Gemini via Google Generative AI API
     # Requires GOOGLE_API_KEY in environment (mapped to settings.gemini_api_key)
-    if not settings.gemini_api_key:
+    if not _API_KEY:
         raise ValueError("GOOGLE_API_KEY must be set for Gemini (Generative AI API)")
 
     return ChatGoogleGenerativeAI(
         model=model_name,
         temperature=temperature,
-        api_key=settings.gemini_api_key.get_secret_value(),
-        max_retries=3,
-        timeout=30,
+        api_key=_API_KEY,
+        # Sampled clients (multi-completion voting) must not share one cached
+        # answer across attempts; only deterministic clients use the LLM cache
+        cache=None if temperature == 0.0 else False,
+        **_LLM_KW,
     )
 
 
 def get_default_llm() -> BaseChatModel:
     """Get default LLM instance."""
-    return get_llm()
\ No newline at end of file
+    return get_llm()
+
+
+def invalidate_llm_cache() -> None:
+    """Drop cached LLM instances (e.g. after changing settings in tests)."""
+    get_llm.cache_clear()
\ No newline at end of file
@@ -1,15 +1,18 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
 
-from pydantic import Field, SecretStr
+from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
 class Settings(BaseSettings):
     """Manages application settings and environment variables."""
 
-    gemini_api_key: Optional[SecretStr] = Field(default=None, alias="GOOGLE_API_KEY")
+    # Plain str read once at startup; repr=False keeps it out of reprs and logs
+    gemini_api_key: Optional[str] = Field(default=None, alias="GOOGLE_API_KEY", repr=False, exclude=True)
     gcp_project: Optional[str] = Field(default=None, alias="GCP_PROJECT")
     gcp_location: Optional[str] = Field(default=None, alias="GCP_LOCATION")
+    llm_max_retries: int = Field(default=3, alias="LLM_MAX_RETRIES")
+    llm_timeout: float = Field(default=30, alias="LLM_TIMEOUT")
 
     model_config = SettingsConfigDict(
         env_file=".env",